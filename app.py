@@ -1,99 +1,505 @@
 import PyPDF2
+import bisect
+import functools
+import io
+import json
+import mmap
 import os
+import shutil
+import sys
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def get_book_page_mapping(pdf_reader):
+try:
+    import liburing  # optional, Linux only: batched output writes via io_uring
+except ImportError:
+    liburing = None
+if liburing is not None and not hasattr(liburing, 'io_uring'):
+    # liburing 2026+ replaced the io_uring/io_uring_cqe functions this module
+    # uses with Ring/Cqe classes; treat unsupported releases as not installed
+    # so the optional dependency can never break the portable write path
+    liburing = None
+
+try:
+    import pymupdf as fitz  # optional: PyMuPDF, C-backed page copies
+except ImportError:
+    try:
+        import fitz  # PyMuPDF < 1.24 only exposes the deprecated alias
+    except ImportError:
+        fitz = None
+
+try:
+    import pikepdf  # optional: QPDF-backed page copies
+except ImportError:
+    pikepdf = None
+
+try:
+    from tqdm import tqdm  # optional: nicer progress reporting
+except ImportError:
+    tqdm = None
+
+def _get_backend():
     """
-    Create a mapping from book page numbers to PDF page indices.
-    This is a simple implementation - you may need to customize this based on your PDF structure.
+    Pick the page-copy backend: honor $PDF_BACKEND (pymupdf, pikepdf or
+    pypdf2), otherwise prefer a native backend when installed - both MuPDF
+    and QPDF copy pages many times faster than PyPDF2's pure-Python object
+    graph walk.
     """
-    total_pdf_pages = len(pdf_reader.pages)
-    
+    available = {'pymupdf': fitz, 'pikepdf': pikepdf, 'pypdf2': PyPDF2}
+    backend = os.environ.get('PDF_BACKEND', '').lower()
+    if backend in available:
+        if available[backend] is None:
+            print(f"Warning: PDF_BACKEND={backend} but it is not installed; using PyPDF2.")
+            return 'pypdf2'
+        return backend
+    if fitz is not None:
+        return 'pymupdf'
+    if pikepdf is not None:
+        return 'pikepdf'
+    return 'pypdf2'
+
+def _progress(iterable, total=None):
+    """
+    Iterate with batched progress output instead of a print per item.
+
+    Uses tqdm on a TTY when installed; otherwise reports roughly every 1% of
+    items, so a 10000-page job issues ~100 stdout writes instead of 10000.
+    """
+    if total is None:
+        total = len(iterable)
+    if tqdm is not None:
+        yield from tqdm(iterable, total=total, disable=not sys.stderr.isatty())
+        return
+    step = max(1, total // 100)
+    for count, item in enumerate(iterable, 1):
+        yield item
+        if count % step == 0 or count == total:
+            print(f"... {count}/{total}")
+
+@functools.lru_cache(maxsize=4)
+def _load_reader_cached(path, mtime):
+    """Parse a PDF once and reuse the reader for repeated operations on the same file."""
+    with open(path, 'rb') as file:
+        try:
+            # Memory-map the file: pages are faulted in lazily by the kernel and
+            # PyPDF2's many small seek/read calls stay in-process.
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # mmap can fail on empty files or exotic filesystems; fall back to
+            # reading the whole file into memory.
+            buffer = io.BytesIO(file.read())
+    return PyPDF2.PdfReader(buffer)
+
+def _load_reader(input_path):
+    """Return a (cached) PdfReader for input_path, keyed by path and mtime."""
+    path = os.fspath(input_path)
+    return _load_reader_cached(path, os.path.getmtime(path))
+
+def _reader_page_count(pdf_reader):
+    """
+    Page count via the trailer's /Root -> /Pages -> /Count entry - a single
+    indirect-object dereference. len(pdf_reader.pages) flattens the whole
+    page tree, touching every page object just to learn how many there are.
+    """
+    try:
+        return int(pdf_reader.trailer['/Root']['/Pages']['/Count'])
+    except (KeyError, TypeError, ValueError):
+        return len(pdf_reader.pages)
+
+def _contiguous_runs(book_pages):
+    """Group sorted book pages into (low, high) runs of consecutive numbers."""
+    if isinstance(book_pages, IntervalSet):
+        return book_pages.intervals
+    runs = []
+    for page in book_pages:
+        if runs and page == runs[-1][1] + 1:
+            runs[-1] = (runs[-1][0], page)
+        else:
+            runs.append((page, page))
+    return runs
+
+def _partition_book_pages(book_pages, page_mapping):
+    """
+    Split requested book pages into (valid, invalid) against the mapping.
+
+    IntervalSet requests are clamped interval-by-interval against the
+    mapping's contiguous valid range - O(k) in the number of intervals, never
+    per page. Plain iterables fall back to a single set intersection, one
+    pass instead of the old per-page membership loop plus a second filter.
+    """
+    last_book_page = len(page_mapping)
+    if isinstance(book_pages, IntervalSet):
+        valid = []
+        invalid = []
+        for low, high in book_pages.intervals:
+            if max(low, 1) <= min(high, last_book_page):
+                valid.append((max(low, 1), min(high, last_book_page)))
+            if low < 1:
+                invalid.append((low, min(high, 0)))
+            if high > last_book_page:
+                invalid.append((max(low, last_book_page + 1), high))
+        return IntervalSet(valid), IntervalSet(invalid)
+
+    # Single sort, then one bisect per boundary: valid pages are exactly the
+    # contiguous slice inside [1, last_book_page], no per-page membership tests
+    requested = sorted(set(book_pages))
+    first = bisect.bisect_left(requested, 1)
+    last = bisect.bisect_right(requested, last_book_page)
+    return requested[first:last], requested[:first] + requested[last:]
+
+def _copy_pages_pymupdf(input_path, output_path, pdf_index_runs):
+    """Concatenate (start, stop) PDF-index runs into one output file via PyMuPDF."""
+    with fitz.open(input_path) as source:
+        destination = fitz.open()
+        try:
+            for start, stop in pdf_index_runs:
+                destination.insert_pdf(source, from_page=start, to_page=stop - 1)
+            destination.save(output_path)
+        finally:
+            destination.close()
+
+def _split_pages_pymupdf(input_path, items):
+    """Write one single-page PDF per (pdf_index, output_path) pair via PyMuPDF."""
+    with fitz.open(input_path) as source:
+        for pdf_index, output_path in _progress(items):
+            destination = fitz.open()
+            try:
+                destination.insert_pdf(source, from_page=pdf_index, to_page=pdf_index)
+                destination.save(output_path)
+            finally:
+                destination.close()
+
+def _copy_pages_pikepdf(input_path, output_path, pdf_index_runs):
+    """Concatenate (start, stop) PDF-index runs into one output file via pikepdf."""
+    with pikepdf.Pdf.open(input_path) as source, pikepdf.new() as destination:
+        for start, stop in pdf_index_runs:
+            for pdf_index in range(start, stop):
+                destination.pages.append(source.pages[pdf_index])
+        destination.save(output_path)
+
+def _split_pages_pikepdf(input_path, items):
+    """Write one single-page PDF per (pdf_index, output_path) pair via pikepdf."""
+    with pikepdf.Pdf.open(input_path) as source:
+        for pdf_index, output_path in _progress(items):
+            with pikepdf.new() as destination:
+                destination.pages.append(source.pages[pdf_index])
+                destination.save(output_path)
+
+def _split_pages_shared_clone(pdf_reader, items):
+    """
+    Split by cloning the document into one writer and re-pointing its page
+    tree at a single page per output, so shared resources (fonts, images)
+    are resolved once instead of once per page.
+
+    PyPDF2 serializes every object the writer holds, so each output embeds
+    the full shared-resource set and can be much larger than what the
+    per-page path produces - hence opt-in via PDF_SPLIT_SHARED_CLONE=1.
+    Relies on writer internals (_pages, /Kids); returns False so the caller
+    can use the standard path if they do not look as expected.
+    """
+    from PyPDF2.generic import ArrayObject, NameObject, NumberObject
+    base = PyPDF2.PdfWriter()
+    try:
+        base.clone_document_from_reader(pdf_reader)
+        pages_obj = base._pages.get_object()
+        original_kids = pages_obj['/Kids']
+    except Exception:
+        return False
+    try:
+        for pdf_index, output_path in _progress(items):
+            pages_obj[NameObject('/Kids')] = ArrayObject([original_kids[pdf_index]])
+            pages_obj[NameObject('/Count')] = NumberObject(1)
+            with open(output_path, 'wb') as output_file:
+                base.write(output_file)
+    finally:
+        pages_obj[NameObject('/Kids')] = original_kids
+        pages_obj[NameObject('/Count')] = NumberObject(len(original_kids))
+    return True
+
+def _write_pdf(pdf_writer, output_path):
+    """Serialize a PdfWriter to disk; used as the thread-pool work unit."""
+    with open(output_path, 'wb') as output_file:
+        pdf_writer.write(output_file)
+
+def _write_blobs_io_uring(blobs, batch_size=64):
+    """Write (path, data) pairs by submitting batched io_uring write requests.
+
+    Files are opened up front and the actual writes are issued in batches of
+    batch_size submissions per io_uring_enter, amortizing syscall overhead
+    across hundreds of small output files.
+    """
+    ring = liburing.io_uring()
+    cqe = liburing.io_uring_cqe()
+    liburing.io_uring_queue_init(max(batch_size * 2, 8), ring, 0)
+    try:
+        for start in range(0, len(blobs), batch_size):
+            batch = blobs[start:start + batch_size]
+            fds = []
+            try:
+                for index, (output_path, data) in enumerate(batch):
+                    fd = os.open(output_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o644)
+                    fds.append(fd)
+                    sqe = liburing.io_uring_get_sqe(ring)
+                    liburing.io_uring_prep_write(sqe, fd, data, len(data), 0)
+                    # Tag the SQE so the (unordered) completion can be matched
+                    # back to its blob for error reporting and length checks
+                    liburing.io_uring_sqe_set_data64(sqe, index)
+                liburing.io_uring_submit(ring)
+                for _ in batch:
+                    liburing.io_uring_wait_cqe(ring, cqe)
+                    result = cqe.res
+                    output_path, data = batch[cqe.user_data]
+                    liburing.io_uring_cqe_seen(ring, cqe)
+                    if result < 0:
+                        raise OSError(-result, os.strerror(-result), output_path)
+                    if result != len(data):
+                        # Short write (classic disk-full case): write() reports
+                        # a short count rather than an error, but a truncated
+                        # PDF must not pass as success
+                        raise OSError(
+                            f"short write to {output_path}: "
+                            f"{result} of {len(data)} bytes")
+            finally:
+                for fd in fds:
+                    os.close(fd)
+    finally:
+        liburing.io_uring_queue_exit(ring)
+
+def _write_pdfs(jobs):
+    """Write (pdf_writer, output_path) jobs to disk, batching I/O where possible.
+
+    On Linux with the optional liburing bindings installed, each writer is
+    serialized to memory and the file writes are submitted in io_uring batches;
+    everywhere else the writes are overlapped with a thread pool.
+    """
+    if not jobs:
+        return
+    if liburing is not None and sys.platform.startswith('linux'):
+        blobs = []
+        for pdf_writer, output_path in jobs:
+            buffer = io.BytesIO()
+            pdf_writer.write(buffer)
+            blobs.append((output_path, buffer.getvalue()))
+        try:
+            _write_blobs_io_uring(blobs)
+            return
+        except (OSError, AttributeError, TypeError):
+            # io_uring may be unavailable (seccomp, old kernel) or the
+            # bindings' API may have drifted; the writes are idempotent
+            # (O_TRUNC), so redo the whole batch the portable way.
+            pass
+    with ThreadPoolExecutor(max_workers=min(32, len(jobs))) as executor:
+        list(executor.map(lambda job: _write_pdf(job[0], job[1]), jobs))
+
+class OffsetMap:
+    """
+    Arithmetic mapping from book page numbers to PDF page indices.
+
+    Behaves like the {book_page: pdf_index} dict it replaces, but computes
+    every lookup in O(1) instead of materializing an entry per page, so a
+    5000-page book costs two ints instead of a 5000-entry dict.
+    """
+    __slots__ = ('offset', 'total_pdf_pages')
+
+    def __init__(self, offset, total_pdf_pages):
+        self.offset = offset
+        self.total_pdf_pages = total_pdf_pages
+
+    def __contains__(self, book_page):
+        return 1 <= book_page <= self.total_pdf_pages - self.offset
+
+    def __getitem__(self, book_page):
+        if book_page not in self:
+            raise KeyError(book_page)
+        return book_page - 1 + self.offset
+
+    def __len__(self):
+        return self.total_pdf_pages - self.offset
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def keys(self):
+        return range(1, self.total_pdf_pages - self.offset + 1)
+
+    def items(self):
+        return ((book_page, book_page - 1 + self.offset) for book_page in self.keys())
+
+# Mapping answers remembered per reader, so back-to-back operations on the
+# same (cached) reader prompt the user only once
+_mapping_cache = weakref.WeakKeyDictionary()
+
+# Persisting the mapping choice to disk can be disabled with --no-cache
+_use_mapping_cache = True
+
+def _mapping_cache_path(input_path):
+    return Path(input_path).with_suffix('.mapping.json')
+
+def _load_saved_mapping(input_path, total_pdf_pages):
+    """
+    Return the mapping saved beside input_path by an earlier run, or None.
+    The entry is only honored if the file's mtime and page count still match.
+    """
+    if not _use_mapping_cache:
+        return None
+    try:
+        with open(_mapping_cache_path(input_path)) as cache_file:
+            data = json.load(cache_file)
+        if (data.get('mtime') == os.path.getmtime(input_path)
+                and data.get('total') == total_pdf_pages):
+            return OffsetMap(int(data['offset']), total_pdf_pages)
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+def _save_mapping(input_path, mapping):
+    """Persist the chosen mapping beside the input file (atomic via os.replace)."""
+    if not _use_mapping_cache:
+        return
+    cache_path = _mapping_cache_path(input_path)
+    temp_path = cache_path.with_suffix('.mapping.json.tmp')
+    data = {
+        'kind': 'offset',
+        'offset': mapping.offset,
+        'total': mapping.total_pdf_pages,
+        'mtime': os.path.getmtime(input_path),
+    }
+    try:
+        with open(temp_path, 'w') as cache_file:
+            json.dump(data, cache_file)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass  # a cache we cannot write is not worth failing the operation
+
+def build_mapping(total_pdf_pages, choice, offset=0):
+    """
+    Build a book-page mapping without prompting; for scripted callers.
+
+    choice "1" is a 1:1 mapping; choice "2" maps book page 1 to the 0-based
+    PDF index given by offset. Any other choice, or an out-of-range offset,
+    falls back to 1:1.
+    """
+    if choice == "2" and 0 <= offset < total_pdf_pages:
+        return OffsetMap(offset, total_pdf_pages)
+    return OffsetMap(0, total_pdf_pages)
+
+def _prompt_for_mapping(total_pdf_pages):
+    """Interactively ask the user how book pages map onto PDF pages."""
     print(f"Total PDF pages: {total_pdf_pages}")
     print("\nPage mapping options:")
     print("1. Book pages start from page 1 (1:1 mapping)")
     print("2. Custom offset (e.g., book page 1 starts at PDF page 5)")
     print("3. Manual mapping for complex books")
-    
+
     choice = input("Choose mapping option (1, 2, or 3): ").strip()
-    
+
     if choice == "1":
         # Simple 1:1 mapping
-        return {i+1: i for i in range(total_pdf_pages)}
-    
+        return build_mapping(total_pdf_pages, "1")
+
     elif choice == "2":
         # Offset mapping
         try:
             offset = int(input("Enter PDF page number where book page 1 starts: ")) - 1
             if offset < 0 or offset >= total_pdf_pages:
                 print("Invalid offset. Using 1:1 mapping.")
-                return {i+1: i for i in range(total_pdf_pages)}
-            
-            mapping = {}
-            for i in range(total_pdf_pages - offset):
-                mapping[i + 1] = i + offset
-            return mapping
+            return build_mapping(total_pdf_pages, "2", offset)
         except ValueError:
             print("Invalid input. Using 1:1 mapping.")
-            return {i+1: i for i in range(total_pdf_pages)}
-    
+            return build_mapping(total_pdf_pages, "1")
+
     elif choice == "3":
         # Manual mapping (simplified - you can expand this)
         print("Manual mapping not implemented in this version. Using 1:1 mapping.")
-        return {i+1: i for i in range(total_pdf_pages)}
-    
+        return build_mapping(total_pdf_pages, "1")
+
     else:
         print("Invalid choice. Using 1:1 mapping.")
-        return {i+1: i for i in range(total_pdf_pages)}
+        return build_mapping(total_pdf_pages, "1")
+
+def get_book_page_mapping(pdf_reader, input_path=None):
+    """
+    Create a mapping from book page numbers to PDF page indices.
+    This is a simple implementation - you may need to customize this based on your PDF structure.
+    Prompts at most once per reader; repeated operations reuse the first
+    answer, and when input_path is given the choice is persisted beside the
+    file so later runs skip the prompt entirely.
+    """
+    if pdf_reader in _mapping_cache:
+        return _mapping_cache[pdf_reader]
+    total_pdf_pages = _reader_page_count(pdf_reader)
+    mapping = None
+    if input_path is not None:
+        mapping = _load_saved_mapping(input_path, total_pdf_pages)
+        if mapping is not None:
+            print(f"Using saved page mapping from {_mapping_cache_path(input_path)}")
+    if mapping is None:
+        mapping = _prompt_for_mapping(total_pdf_pages)
+        if input_path is not None:
+            _save_mapping(input_path, mapping)
+    _mapping_cache[pdf_reader] = mapping
+    return mapping
 
-def extract_pages_to_single_pdf(input_path, output_path, book_pages):
+def extract_pages_to_single_pdf(input_path, output_path, book_pages, pdf_reader=None):
     """
     Extract specified book pages and concatenate them into a single PDF.
     Args:
         input_path (str): Path to input PDF file
         output_path (str): Path for output PDF file
         book_pages (list): List of book page numbers to extract
+        pdf_reader (PyPDF2.PdfReader or None): Pre-built reader to reuse, or None to load one
     """
     try:
-        # Open the PDF file
-        with open(input_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            
-            # Get page mapping
-            page_mapping = get_book_page_mapping(pdf_reader)
-            
-            # Validate book pages
-            invalid_pages = []
-            valid_pdf_indices = []
-            
-            for book_page in book_pages:
-                if book_page not in page_mapping:
-                    invalid_pages.append(book_page)
-                else:
-                    valid_pdf_indices.append(page_mapping[book_page])
-            
-            if invalid_pages:
-                print(f"Warning: Invalid book pages: {invalid_pages}")
-                if not valid_pdf_indices:
-                    print("No valid pages to extract.")
-                    return False
-            
-            # Create output PDF with selected pages
+        # Open the PDF file (reusing the caller's reader if one was provided)
+        if pdf_reader is None:
+            pdf_reader = _load_reader(input_path)
+
+        # Get page mapping
+        page_mapping = get_book_page_mapping(pdf_reader, input_path)
+
+        # Validate book pages
+        valid_pages, invalid_pages = _partition_book_pages(book_pages, page_mapping)
+
+        if invalid_pages:
+            print(f"Warning: Invalid book pages: {invalid_pages}")
+            if not valid_pages:
+                print("No valid pages to extract.")
+                return False
+
+        # Degenerate case: a 1:1 mapping with every page selected reproduces
+        # the input byte-for-byte, so copy the file instead of round-tripping
+        # it through a PDF library (which would also strip features the
+        # rewrite does not understand)
+        if page_mapping.offset == 0 and len(valid_pages) == len(page_mapping):
+            print("\nAll pages selected with 1:1 mapping; copying input directly.")
+            shutil.copyfile(input_path, output_path)
+            print(f"\nSuccessfully created: {output_path}")
+            return True
+
+        # Copy each contiguous run in bulk; the monotonic mapping keeps runs
+        # contiguous in the PDF (valid_pages is sorted, so indices are too)
+        print(f"\nExtracting book pages: {valid_pages}")
+        runs = _contiguous_runs(valid_pages)
+        pdf_index_runs = [(page_mapping[low], page_mapping[high] + 1) for low, high in runs]
+
+        backend = _get_backend()
+        if backend == 'pymupdf':
+            _copy_pages_pymupdf(input_path, output_path, pdf_index_runs)
+        elif backend == 'pikepdf':
+            _copy_pages_pikepdf(input_path, output_path, pdf_index_runs)
+        else:
             pdf_writer = PyPDF2.PdfWriter()
-            
-            print(f"\nExtracting book pages: {sorted([p for p in book_pages if p in page_mapping])}")
-            for pdf_index in sorted(valid_pdf_indices):
-                pdf_writer.add_page(pdf_reader.pages[pdf_index])
-                book_page = next(bp for bp, pi in page_mapping.items() if pi == pdf_index)
-                print(f"Added book page {book_page} (PDF page {pdf_index + 1})")
-            
+            for start, stop in _progress(pdf_index_runs):
+                pdf_writer.append(pdf_reader, pages=(start, stop))
+
             # Write the output PDF
             with open(output_path, 'wb') as output_file:
                 pdf_writer.write(output_file)
-            
-            print(f"\nSuccessfully created: {output_path}")
-            return True
-        
+
+        print(f"\nSuccessfully created: {output_path}")
+        return True
+
     except FileNotFoundError:
         print(f"Error: Input file '{input_path}' not found.")
         return False
@@ -101,55 +507,86 @@ def extract_pages_to_single_pdf(input_path, output_path, book_pages):
         print(f"An error occurred: {str(e)}")
         return False
 
-def split_pdf_individual_pages(input_path, output_dir, book_pages=None):
+def split_pdf_individual_pages(input_path, output_dir, book_pages=None, pdf_reader=None):
     """
     Split a PDF into individual pages (original functionality with book page numbering).
     Args:
         input_path (str): Path to input PDF file
         output_dir (str): Directory to save output PDFs
         book_pages (list or None): List of book page numbers to split, None for all pages
+        pdf_reader (PyPDF2.PdfReader or None): Pre-built reader to reuse, or None to load one
     """
     try:
-        # Ensure output directory exists
+        # Ensure output directory exists; build the filename template once so
+        # the per-page loop does a single str.format instead of os.path.join
         Path(output_dir).mkdir(parents=True, exist_ok=True)
-        
-        # Open the PDF file
-        with open(input_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            
-            # Get page mapping
-            page_mapping = get_book_page_mapping(pdf_reader)
-            
-            if book_pages is None:
-                book_pages = list(page_mapping.keys())
-            
-            # Validate book pages
-            invalid_pages = []
-            for book_page in book_pages:
-                if book_page not in page_mapping:
-                    invalid_pages.append(book_page)
-            
-            if invalid_pages:
-                print(f"Error: Invalid book pages: {invalid_pages}")
-                valid_pages = [p for p in book_pages if p in page_mapping]
-                if not valid_pages:
-                    return False
-                book_pages = valid_pages
-            
-            # Split pages
-            for book_page in book_pages:
+        output_template = str(Path(output_dir) / 'book_page_{}.pdf')
+
+        # Open the PDF file (reusing the caller's reader if one was provided)
+        if pdf_reader is None:
+            pdf_reader = _load_reader(input_path)
+
+        # Get page mapping
+        page_mapping = get_book_page_mapping(pdf_reader, input_path)
+
+        if book_pages is None:
+            book_pages = IntervalSet([(1, len(page_mapping))])
+
+        # Validate book pages
+        book_pages, invalid_pages = _partition_book_pages(book_pages, page_mapping)
+
+        if invalid_pages:
+            print(f"Error: Invalid book pages: {invalid_pages}")
+            if not book_pages:
+                return False
+
+        backend = _get_backend()
+        if backend in ('pymupdf', 'pikepdf'):
+            items = [(page_mapping[book_page], output_template.format(book_page))
+                     for book_page in book_pages]
+            if backend == 'pymupdf':
+                _split_pages_pymupdf(input_path, items)
+            else:
+                _split_pages_pikepdf(input_path, items)
+            created = len(items)
+        elif (os.environ.get('PDF_SPLIT_SHARED_CLONE') == '1'
+              and _split_pages_shared_clone(
+                  pdf_reader,
+                  [(page_mapping[book_page], output_template.format(book_page))
+                   for book_page in book_pages])):
+            created = len(book_pages)
+        else:
+            # Snapshot the page sequence once: PdfReader.pages is a virtual
+            # list whose __getitem__ may re-walk the page tree per call, so
+            # flatten it in a single pass instead of indexing it N times.
+            pages_list = list(pdf_reader.pages)
+
+            # Build writers in this thread (PdfReader page access is not
+            # guaranteed thread-safe across PyPDF2 versions) and flush them in
+            # chunks of ~2x the write-pool width: each writer holds a full
+            # clone of its page and resources, so building all N up front
+            # would put the whole document in memory at once.
+            chunk_size = 64
+            jobs = []
+            created = 0
+            for book_page in _progress(book_pages):
                 pdf_writer = PyPDF2.PdfWriter()
                 pdf_index = page_mapping[book_page]
-                pdf_writer.add_page(pdf_reader.pages[pdf_index])
-                
-                output_path = os.path.join(output_dir, f'book_page_{book_page}.pdf')
-                with open(output_path, 'wb') as output_file:
-                    pdf_writer.write(output_file)
-                print(f"Created: {output_path} (book page {book_page})")
+                pdf_writer.add_page(pages_list[pdf_index])
+
+                jobs.append((pdf_writer, output_template.format(book_page)))
+                if len(jobs) >= chunk_size:
+                    _write_pdfs(jobs)
+                    created += len(jobs)
+                    jobs = []
 
+            _write_pdfs(jobs)
+            created += len(jobs)
+
+        print(f"Created {created} files in {output_dir}")
         print("PDF splitting completed successfully!")
         return True
-        
+
     except FileNotFoundError:
         print(f"Error: Input file '{input_path}' not found.")
         return False
@@ -157,28 +594,66 @@ def split_pdf_individual_pages(input_path, output_dir, book_pages=None):
         print(f"An error occurred: {str(e)}")
         return False
 
+class IntervalSet:
+    """
+    Sorted set of page numbers stored as disjoint (low, high) intervals.
+
+    An input like "1-50000,60000-90000" costs two tuples instead of 80001
+    list entries: iteration yields each page lazily and membership is a
+    binary search over the interval starts.
+    """
+    __slots__ = ('intervals', '_starts')
+
+    def __init__(self, intervals):
+        # Sort by start, then merge overlapping or adjacent intervals
+        merged = []
+        for low, high in sorted(intervals):
+            if merged and low <= merged[-1][1] + 1:
+                if high > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], high)
+            else:
+                merged.append((low, high))
+        self.intervals = merged
+        self._starts = [low for low, _ in merged]
+
+    def __iter__(self):
+        for low, high in self.intervals:
+            yield from range(low, high + 1)
+
+    def __len__(self):
+        return sum(high - low + 1 for low, high in self.intervals)
+
+    def __contains__(self, page):
+        i = bisect.bisect_right(self._starts, page) - 1
+        return i >= 0 and page <= self.intervals[i][1]
+
+    def __repr__(self):
+        parts = [str(low) if low == high else f"{low}-{high}" for low, high in self.intervals]
+        return '[' + ', '.join(parts) + ']'
+
 def parse_page_numbers(page_input):
     """Parse page numbers from user input (supports ranges and comma-separated values)."""
-    pages = []
-    
+    intervals = []
+
     for part in page_input.split(','):
         part = part.strip()
         if '-' in part:
             try:
                 start, end = map(int, part.split('-'))
                 if start <= end:
-                    pages.extend(range(start, end + 1))
+                    intervals.append((start, end))
                 else:
                     print(f"Warning: Invalid range {part} (start > end)")
             except ValueError:
                 print(f"Warning: Invalid page range format: {part}")
         else:
             try:
-                pages.append(int(part))
+                page = int(part)
+                intervals.append((page, page))
             except ValueError:
                 print(f"Warning: Invalid page number: {part}")
-    
-    return sorted(list(set(pages)))  # Remove duplicates and sort
+
+    return IntervalSet(intervals)
 
 def main():
     print("=== PDF Page Extractor ===")
@@ -194,7 +669,14 @@ def main():
         if not os.path.isfile(input_path):
             print("Error: File does not exist. Please try again.")
             continue
-        
+
+        # Parse the PDF once; both operations below reuse the same reader
+        try:
+            pdf_reader = _load_reader(input_path)
+        except Exception as e:
+            print(f"Error: Could not read PDF: {str(e)}")
+            continue
+
         # Choose operation mode
         print("\nOperation options:")
         print("1. Extract pages to individual PDF files")
@@ -228,7 +710,7 @@ def main():
             if not output_dir:
                 output_dir = default_output
             
-            split_pdf_individual_pages(input_path, output_dir, book_pages)
+            split_pdf_individual_pages(input_path, output_dir, book_pages, pdf_reader=pdf_reader)
             
         elif mode == "2":
             # Single concatenated PDF
@@ -242,7 +724,7 @@ def main():
                 print("Cannot concatenate all pages without specifying which pages to extract.")
                 continue
                 
-            extract_pages_to_single_pdf(input_path, output_path, book_pages)
+            extract_pages_to_single_pdf(input_path, output_path, book_pages, pdf_reader=pdf_reader)
 
 if __name__ == "__main__":
     # Check if PyPDF2 is installed
@@ -252,5 +734,8 @@ if __name__ == "__main__":
         print("Error: PyPDF2 library is not installed.")
         print("Please install it using: pip install PyPDF2")
         exit(1)
-    
+
+    if '--no-cache' in sys.argv[1:]:
+        _use_mapping_cache = False
+
     main()
\ No newline at end of file